@@ -5,18 +5,39 @@ This module provides functions to automate Power BI Desktop for converting
 PBIX files to PBIP project format using Windows UI automation.
 """
 
+import io
 import os
+import re
+import sys
 import time
+import ctypes
+import winreg
+import functools
+import threading
+import contextlib
 import subprocess
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from ctypes import wintypes
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Callable, Iterator, List, Optional, Tuple
 
 import psutil
 import pyautogui
-import pyperclip
 from pywinauto import Application, Desktop
-from pywinauto.findwindows import ElementNotFoundError
+from pywinauto.application import ProcessNotFoundError
+from pywinauto.findwindows import ElementAmbiguousError, ElementNotFoundError
+from pywinauto.keyboard import send_keys
 from pywinauto.timings import TimeoutError as PywinautoTimeoutError
+from pywinauto.uia_defines import NoPatternInterfaceError
+
+# Keystrokes are sent through pywinauto's send_keys with pause=0, as its
+# default 50 ms sleep after every key adds seconds to a typed path. Likewise
+# drop pyautogui's implicit 100 ms pause and the fail-safe cursor position
+# check on each of the remaining pyautogui calls. Settle delays the UI
+# actually needs are explicit.
+pyautogui.PAUSE = 0
+pyautogui.FAILSAFE = False
 
 
 # Common Power BI Desktop installation paths
@@ -27,30 +48,337 @@ PBI_DESKTOP_PATHS = [
     os.path.expandvars(r"%LOCALAPPDATA%\Microsoft\WindowsApps\Microsoft.MicrosoftPowerBIDesktop_8wekyb3d8bbwe\PBIDesktop.exe"),
 ]
 
+# Registry locations that record the Power BI Desktop install (key, value name)
+PBI_DESKTOP_REGISTRY_KEYS = [
+    (r"SOFTWARE\Microsoft\Windows\CurrentVersion\App Paths\PBIDesktop.exe", ""),
+    (r"SOFTWARE\Microsoft\Microsoft Power BI Desktop", "InstallPath"),
+]
+
 # Timeouts (in seconds)
 STARTUP_TIMEOUT = 120  # Max time to wait for PBI Desktop to start
 DIALOG_TIMEOUT = 30    # Max time to wait for dialogs
 SAVE_TIMEOUT = 60      # Max time to wait for save operation
 
+# Window class of the Power BI Desktop main window
+PBI_MAIN_WINDOW_CLASS = "LM_WORKBENCH"
+
+# Title patterns, compiled once and passed straight to pywinauto. The main
+# window pattern also serves as its wrapper cache key.
+_MAIN_WINDOW_RE = re.compile(r".*Power BI Desktop.*")
+_SAVE_DIALOG_RE = re.compile(r".*Save.*", re.IGNORECASE)
+_OPEN_DIALOG_RE = re.compile(r"Open.*", re.IGNORECASE)
+_CONFIRM_SAVE_RE = re.compile(r"Confirm Save As.*", re.IGNORECASE)
+
+# Characters that need escaping in pywinauto send_keys sequences
+_SEND_KEYS_SPECIAL_RE = re.compile(r"([+^%~(){}\[\]])")
+
+# Errors meaning a dialog control or its UIA pattern isn't available, so the
+# keyboard fallback should be used instead
+_CONTROL_ERRORS = (ElementNotFoundError, ElementAmbiguousError, NoPatternInterfaceError)
+
+# Standard Win32 dialog class used by the Save As and Open dialogs
+SAVE_DIALOG_CLASS = "#32770"
+
+# Fallback probe intervals (in seconds) used in case a window event is missed
+STARTUP_POLL_INTERVAL = 2
+FAST_POLL_INTERVAL = 0.1  # For the exact-title FindWindowExW lookup
+DIALOG_POLL_INTERVAL = 0.5
+
+# Longest single block while waiting for the save, so a stop request or
+# Ctrl+C is noticed promptly
+SAVE_WAIT_SLICE = 1
+
+# WinEvent constants (winuser.h)
+EVENT_OBJECT_SHOW = 0x8002
+EVENT_OBJECT_NAMECHANGE = 0x800C
+WINEVENT_OUTOFCONTEXT = 0x0000
+OBJID_WINDOW = 0
+WM_QUIT = 0x0012
+
+# Directory change notification constants (winbase.h / winnt.h)
+FILE_NOTIFY_CHANGE_FILE_NAME = 0x00000001
+FILE_NOTIFY_CHANGE_DIR_NAME = 0x00000002
+FILE_NOTIFY_CHANGE_LAST_WRITE = 0x00000010
+INVALID_HANDLE_VALUE = wintypes.HANDLE(-1).value
+WAIT_OBJECT_0 = 0x00000000
+WAIT_TIMEOUT = 0x00000102
+
+# Thread priority and timer resolution (winbase.h / timeapi.h)
+THREAD_PRIORITY_ABOVE_NORMAL = 1
+TIMER_RESOLUTION_MS = 1
+
+_WINEVENTPROC = ctypes.WINFUNCTYPE(
+    None,
+    wintypes.HANDLE,
+    wintypes.DWORD,
+    wintypes.HWND,
+    wintypes.LONG,
+    wintypes.LONG,
+    wintypes.DWORD,
+    wintypes.DWORD,
+)
+
 
 class PBIAutomationError(Exception):
     """Custom exception for Power BI automation errors."""
     pass
 
 
+# Resolved pywinauto wrappers, keyed by (pid, title_re). Resolving a wrapper
+# walks the UIA tree, so it is done once per long-lived window (the main
+# window) and reused. One-shot dialogs aren't cached.
+_wrapper_cache = {}
+
+# Lock shared by convert_pbix_parallel worker processes. Set only inside a
+# worker; None means this process is the only one driving Power BI Desktop.
+_input_lock = None
+
+# Last is_pbi_desktop_running() result and when it was taken
+_running_cache = {'ts': None, 'val': False}
+RUNNING_CACHE_TTL = 5  # Seconds to reuse the result for
+
+
+class WindowWatcher:
+    """
+    Signal as soon as a window with a matching title is shown or renamed.
+
+    Installs an out-of-context SetWinEventHook on a background thread (which
+    pumps the messages the hook needs) so callers can block on wait() instead
+    of sleeping between UI Automation probes. If the hook cannot be
+    installed, wait() simply sleeps for the timeout, so callers keep their
+    polling behaviour.
+    """
+
+    def __init__(self, title_matches: Callable[[str], bool]):
+        self._title_matches = title_matches
+        self._event = threading.Event()
+        self._ready = threading.Event()
+        self._thread = None
+        self._thread_id = 0
+        # Keep a reference so the callback isn't garbage collected
+        self._proc = _WINEVENTPROC(self._on_event)
+
+    def __enter__(self) -> "WindowWatcher":
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        self._ready.wait(1)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        if self._thread_id:
+            ctypes.windll.user32.PostThreadMessageW(self._thread_id, WM_QUIT, 0, 0)
+        if self._thread:
+            self._thread.join(1)
+
+    def wait(self, timeout: float) -> bool:
+        """
+        Wait until a matching window appears or the timeout elapses.
+
+        Returns:
+            True if a matching window event was seen, False on timeout.
+        """
+        seen = self._event.wait(timeout)
+        self._event.clear()
+        return seen
+
+    def _on_event(self, hook, event, hwnd, id_object, id_child, thread, event_time):
+        if id_object != OBJID_WINDOW or not hwnd:
+            return
+        try:
+            user32 = ctypes.windll.user32
+            length = user32.GetWindowTextLengthW(hwnd)
+            if length <= 0:
+                return
+            buffer = ctypes.create_unicode_buffer(length + 1)
+            user32.GetWindowTextW(hwnd, buffer, length + 1)
+            if self._title_matches(buffer.value):
+                self._event.set()
+        except Exception:
+            pass
+
+    def _run(self) -> None:
+        user32 = ctypes.windll.user32
+        self._thread_id = ctypes.windll.kernel32.GetCurrentThreadId()
+
+        hooks = [
+            user32.SetWinEventHook(
+                event, event, 0, self._proc, 0, 0, WINEVENT_OUTOFCONTEXT
+            )
+            for event in (EVENT_OBJECT_SHOW, EVENT_OBJECT_NAMECHANGE)
+        ]
+        self._ready.set()
+
+        try:
+            if any(hooks):
+                msg = wintypes.MSG()
+                while user32.GetMessageW(ctypes.byref(msg), 0, 0, 0) > 0:
+                    user32.TranslateMessage(ctypes.byref(msg))
+                    user32.DispatchMessageW(ctypes.byref(msg))
+        finally:
+            for hook in hooks:
+                if hook:
+                    user32.UnhookWinEvent(hook)
+
+
+def wait_until(condition: Callable[[], bool], timeout: float, interval: float = 0.05) -> bool:
+    """
+    Poll a condition until it holds or the timeout elapses.
+
+    Exceptions raised by the condition (e.g. a window disappearing while it
+    is inspected) are treated as the condition not holding yet.
+
+    Args:
+        condition: Callable returning True once the wait is over.
+        timeout: Maximum seconds to wait.
+        interval: Seconds to sleep between checks.
+
+    Returns:
+        True if the condition was met, False on timeout.
+    """
+    deadline = time.perf_counter() + timeout
+    while True:
+        try:
+            if condition():
+                return True
+        except Exception:
+            pass
+        if time.perf_counter() >= deadline:
+            return False
+        time.sleep(interval)
+
+
+def _window_pid(hwnd: int) -> int:
+    """Return the ID of the process owning a window."""
+    pid = wintypes.DWORD()
+    ctypes.windll.user32.GetWindowThreadProcessId(hwnd, ctypes.byref(pid))
+    return pid.value
+
+
+def ensure_foreground(window, timeout: float = 1.0) -> None:
+    """
+    Make sure keyboard input goes to the process owning a window.
+
+    Called before each keyboard step: another Power BI Desktop instance that
+    finishes loading can take the foreground at any time, even while the
+    parallel input lock is held. Any window of the same process (a menu or
+    dialog of the window) counts as the foreground.
+
+    Args:
+        window: pywinauto wrapper of the window that should receive input.
+        timeout: Maximum seconds to wait for the window to come forward.
+
+    Raises:
+        PBIAutomationError: If the window can't be brought to the foreground.
+    """
+    pid = window.process_id()
+    user32 = ctypes.windll.user32
+
+    def owns_foreground():
+        return _window_pid(user32.GetForegroundWindow()) == pid
+
+    if owns_foreground():
+        return
+
+    window.set_focus()
+    if not wait_until(owns_foreground, timeout=timeout):
+        raise PBIAutomationError(
+            "Power BI Desktop lost the keyboard focus to another window"
+        )
+
+
+def get_cached_wrapper(pid: int, title_re: re.Pattern, resolve: Callable):
+    """
+    Return a cached wrapper for a window, resolving it if needed.
+
+    Args:
+        pid: Process ID owning the window.
+        title_re: Title pattern identifying the window within the process.
+        resolve: Callable returning the wrapper (or None) on a cache miss.
+
+    Returns:
+        The wrapper, or None if it could not be resolved.
+    """
+    key = (pid, title_re)
+    wrapper = _wrapper_cache.get(key)
+    if wrapper is not None:
+        try:
+            if wrapper.is_visible():
+                return wrapper
+        except Exception:
+            pass
+        del _wrapper_cache[key]
+
+    wrapper = resolve()
+    if wrapper is not None:
+        _wrapper_cache[key] = wrapper
+    return wrapper
+
+
+def get_main_wrapper(app: Application):
+    """
+    Get the UIA wrapper for the Power BI Desktop main window.
+
+    Args:
+        app: pywinauto Application connected to Power BI Desktop (any backend).
+
+    Returns:
+        Cached UIA wrapper of the top-level window.
+    """
+    return get_cached_wrapper(
+        app.process,
+        _MAIN_WINDOW_RE,
+        lambda: Application(backend='uia').connect(
+            process=app.process
+        ).top_window().wrapper_object()
+    )
+
+
+def find_pbi_desktop_in_registry() -> Optional[str]:
+    """
+    Locate Power BI Desktop executable from its registry entries.
+
+    Returns:
+        Path to PBIDesktop.exe if found, None otherwise.
+    """
+    for key_path, value_name in PBI_DESKTOP_REGISTRY_KEYS:
+        try:
+            with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, key_path) as key:
+                value, _ = winreg.QueryValueEx(key, value_name)
+        except OSError:
+            continue
+
+        path = os.path.expandvars(str(value).strip('"'))
+        if os.path.isdir(path):
+            # InstallPath points at the install folder, not the executable
+            path = os.path.join(path, "bin", "PBIDesktop.exe")
+        if os.path.exists(path):
+            return path
+
+    return None
+
+
+@functools.lru_cache(maxsize=1)
 def find_pbi_desktop() -> Optional[str]:
     """
     Locate Power BI Desktop executable on the system.
 
+    The result is cached for the lifetime of the process; call
+    find_pbi_desktop.cache_clear() to force a new lookup.
+
     Returns:
         Path to PBIDesktop.exe if found, None otherwise.
     """
+    # Entries are already expanded when the list is built
     for path in PBI_DESKTOP_PATHS:
-        expanded_path = os.path.expandvars(path)
-        if os.path.exists(expanded_path):
-            return expanded_path
+        if os.path.exists(path):
+            return path
+
+    # Try the registry before paying for a where.exe subprocess
+    registry_path = find_pbi_desktop_in_registry()
+    if registry_path:
+        return registry_path
 
-    # Try to find via registry or PATH
+    # Try to find via PATH
     try:
         result = subprocess.run(
             ["where", "PBIDesktop.exe"],
@@ -66,68 +394,222 @@ def find_pbi_desktop() -> Optional[str]:
     return None
 
 
-def is_pbi_desktop_running() -> bool:
-    """Check if Power BI Desktop is currently running."""
+def _find_pbi_pids(pids: Optional[set] = None) -> List[psutil.Process]:
+    """
+    Find all running Power BI Desktop processes in a single pass.
+
+    Args:
+        pids: Optional set of PIDs to restrict the search to. The processes
+            and their descendants are checked instead of every process on the
+            system. Descendants are matched by parent PID and added to the
+            set, so they are still recognized after the process that started
+            them has exited.
+
+    Returns:
+        List of psutil.Process objects for PBI Desktop processes.
+    """
+    matches = []
+
+    if pids is not None:
+        procs = []
+        for proc in psutil.process_iter(['ppid', 'name']):
+            procs.append((proc, proc.info['ppid'], proc.info['name']))
+
+        # Repeat until no new descendants turn up, as a child can be listed
+        # before its parent
+        found = True
+        while found:
+            found = False
+            for proc, ppid, _ in procs:
+                if ppid in pids and proc.pid not in pids:
+                    pids.add(proc.pid)
+                    found = True
+
+        for proc, _, name in procs:
+            if proc.pid in pids and name and 'pbidesktop' in name.lower():
+                matches.append(proc)
+        return matches
+
     for proc in psutil.process_iter(['name']):
         try:
-            if proc.info['name'] and 'pbidesktop' in proc.info['name'].lower():
-                return True
+            name = proc.info['name']
+            if name and 'pbidesktop' in name.lower():
+                matches.append(proc)
         except (psutil.NoSuchProcess, psutil.AccessDenied):
             continue
-    return False
+    return matches
+
+
+def _invalidate_running_cache() -> None:
+    """Forget the cached is_pbi_desktop_running() result."""
+    _running_cache['ts'] = None
+
+
+def is_pbi_desktop_running() -> bool:
+    """
+    Check if Power BI Desktop is currently running.
+
+    The result is reused for RUNNING_CACHE_TTL seconds, so repeated checks
+    during a batch don't each enumerate every process. Starting or killing
+    Power BI Desktop through this module invalidates it.
+    """
+    now = time.monotonic()
+    ts = _running_cache['ts']
+    if ts is not None and now - ts < RUNNING_CACHE_TTL:
+        return _running_cache['val']
 
+    running = bool(_find_pbi_pids())
+    _running_cache.update(ts=now, val=running)
+    return running
 
-def kill_pbi_desktop() -> bool:
+
+def kill_pbi_desktop(processes: Optional[List[psutil.Process]] = None) -> bool:
     """
     Forcefully terminate all Power BI Desktop processes.
 
+    Args:
+        processes: Processes to kill, as returned by _find_pbi_pids().
+            If None, the running processes are enumerated.
+
     Returns:
         True if any processes were killed, False otherwise.
     """
-    killed = False
-    for proc in psutil.process_iter(['name', 'pid']):
+    if processes is None:
+        processes = _find_pbi_pids()
+
+    killed = []
+    for proc in processes:
         try:
-            if proc.info['name'] and 'pbidesktop' in proc.info['name'].lower():
-                proc.kill()
-                killed = True
+            proc.kill()
+            killed.append(proc)
         except (psutil.NoSuchProcess, psutil.AccessDenied):
             continue
 
     if killed:
-        time.sleep(2)  # Wait for processes to fully terminate
+        _wrapper_cache.clear()
+        _invalidate_running_cache()
+        # Wait for processes to fully terminate; returns as soon as all
+        # of them have been reaped
+        psutil.wait_procs(killed, timeout=5)
+
+    return bool(killed)
+
+
+@contextlib.contextmanager
+def high_resolution_timer():
+    """
+    Context manager raising the system timer resolution to 1 ms.
 
-    return killed
+    The default 15.6 ms tick rounds up every short time.sleep() and wait
+    timeout, which adds up across the many settle delays of a conversion.
+    """
+    winmm = ctypes.windll.winmm
+    winmm.timeBeginPeriod(TIMER_RESOLUTION_MS)
+    try:
+        yield
+    finally:
+        winmm.timeEndPeriod(TIMER_RESOLUTION_MS)
 
 
-def open_pbix(pbix_path: str, pbi_exe_path: str) -> subprocess.Popen:
+def _raise_thread_priority() -> None:
+    """Raise the calling thread's priority to above normal."""
+    kernel32 = ctypes.windll.kernel32
+    kernel32.SetThreadPriority(kernel32.GetCurrentThread(), THREAD_PRIORITY_ABOVE_NORMAL)
+
+
+def exclusive_input():
+    """
+    Context manager for steps that drive the keyboard or window focus.
+
+    In a convert_pbix_parallel worker this holds the lock shared by all
+    workers, so only one Power BI Desktop instance receives input at a time.
+    Otherwise it does nothing.
+    """
+    if _input_lock is None:
+        return contextlib.nullcontext()
+    return _input_lock
+
+
+def open_pbix(pbix_path: str, pbi_exe_path: str) -> int:
     """
     Open a PBIX file in Power BI Desktop.
 
+    The process is started detached. Power BI Desktop hands off to a child
+    process, so it is tracked and closed by process name, or as a descendant
+    of the returned PID, rather than through the launcher's handle.
+
     Args:
         pbix_path: Full path to the PBIX file.
         pbi_exe_path: Path to Power BI Desktop executable.
 
     Returns:
-        Popen object for the started process.
+        PID of the started process.
     """
     abs_path = os.path.abspath(pbix_path)
     if not os.path.exists(abs_path):
         raise PBIAutomationError(f"PBIX file not found: {abs_path}")
 
-    process = subprocess.Popen([pbi_exe_path, abs_path])
-    return process
+    process = subprocess.Popen(
+        [pbi_exe_path, abs_path],
+        creationflags=subprocess.DETACHED_PROCESS
+    )
+    _invalidate_running_cache()
+    return process.pid
+
 
+def wait_for_pbi_loaded(main_window) -> None:
+    """
+    Give a visible Power BI Desktop main window time to finish initializing.
 
-def wait_for_pbi_ready(filename: str, timeout: int = STARTUP_TIMEOUT) -> Application:
+    Args:
+        main_window: pywinauto window specification of the main window.
+    """
+    loading = main_window.child_window(title_re="Loading.*")
+    wait_until(
+        lambda: main_window.is_enabled() and not loading.exists(timeout=0),
+        timeout=10
+    )
+
+
+def _find_visible_window(title: str, pids: Optional[set] = None) -> int:
+    """
+    Find a visible top-level window with an exact title.
+
+    Args:
+        title: Window title.
+        pids: If given, only windows owned by these processes are accepted.
+
+    Returns:
+        Window handle, or 0 if there is none.
+    """
+    user32 = ctypes.windll.user32
+    hwnd = user32.FindWindowExW(0, 0, None, title)
+    while hwnd:
+        if user32.IsWindowVisible(hwnd) and (pids is None or _window_pid(hwnd) in pids):
+            return hwnd
+        hwnd = user32.FindWindowExW(0, hwnd, None, title)
+    return 0
+
+
+def wait_for_pbi_ready(
+    filename: str,
+    timeout: int = STARTUP_TIMEOUT,
+    owned_pids: Optional[set] = None
+) -> Application:
     """
     Wait for Power BI Desktop to fully load a file.
 
     Args:
         filename: Name of the PBIX file (without path) to look for in title.
         timeout: Maximum seconds to wait.
+        owned_pids: If given, only windows of these processes and their
+            descendants are accepted; descendants found are added to the
+            set. Parallel workers pass the instances they started, as the
+            title pattern also matches other files whose names contain this
+            one (e.g. "Sales 2" for "Sales").
 
     Returns:
-        pywinauto Application object connected to PBI Desktop.
+        pywinauto Application object (win32 backend) connected to PBI Desktop.
 
     Raises:
         PBIAutomationError: If timeout is reached.
@@ -135,26 +617,57 @@ def wait_for_pbi_ready(filename: str, timeout: int = STARTUP_TIMEOUT) -> Applica
     base_name = Path(filename).stem
     start_time = time.time()
 
-    while time.time() - start_time < timeout:
-        try:
-            # Look for window with the file name in title
-            app = Application(backend='uia').connect(
-                title_re=f".*{base_name}.*Power BI Desktop.*",
-                timeout=5
-            )
-
-            main_window = app.window(title_re=f".*{base_name}.*Power BI Desktop.*")
-
-            # Wait for window to be ready (not showing loading)
-            if main_window.exists() and main_window.is_visible():
-                # Give it a bit more time to fully initialize
-                time.sleep(3)
+    # Title Power BI Desktop normally shows once the file is loaded
+    exact_title = f"{base_name} - Power BI Desktop"
+
+    # Escape the name so regex metacharacters in filenames match literally
+    title_re = re.compile(rf".*{re.escape(base_name)}.*Power BI Desktop.*")
+    next_probe = start_time
+
+    with WindowWatcher(title_re.match) as watcher:
+        while time.time() - start_time < timeout:
+            pids = None
+            if owned_pids is not None:
+                pids = {proc.pid for proc in _find_pbi_pids(owned_pids)}
+
+            # Fast path: an exact title lookup is a single call, and
+            # connecting by handle skips the window enumeration
+            hwnd = _find_visible_window(exact_title, pids)
+            if hwnd:
+                app = Application(backend='win32').connect(handle=hwnd)
+                wait_for_pbi_loaded(app.window(handle=hwnd))
                 return app
 
-        except (ElementNotFoundError, PywinautoTimeoutError):
-            pass
-
-        time.sleep(2)
+            # Slower regex probe, for titles that differ from the usual form
+            if time.time() >= next_probe:
+                next_probe = time.time() + STARTUP_POLL_INTERVAL
+                # The win32 backend is much cheaper than uia for a plain
+                # title lookup; save_as_pbip upgrades to uia once it needs
+                # to inspect dialog controls.
+                if pids is None:
+                    candidates = [{'title_re': title_re, 'timeout': 1}]
+                else:
+                    candidates = [{'process': pid} for pid in pids]
+
+                for criteria in candidates:
+                    try:
+                        app = Application(backend='win32').connect(**criteria)
+
+                        main_window = app.window(
+                            title_re=title_re,
+                            class_name=PBI_MAIN_WINDOW_CLASS
+                        )
+
+                        # Wait for window to be ready (not showing loading)
+                        if main_window.exists() and main_window.is_visible():
+                            wait_for_pbi_loaded(main_window)
+                            return app
+
+                    except (ElementNotFoundError, PywinautoTimeoutError, ProcessNotFoundError):
+                        pass
+
+            # Returns early as soon as a matching window is shown
+            watcher.wait(FAST_POLL_INTERVAL)
 
     raise PBIAutomationError(
         f"Timeout waiting for Power BI Desktop to load '{filename}'. "
@@ -162,207 +675,378 @@ def wait_for_pbi_ready(filename: str, timeout: int = STARTUP_TIMEOUT) -> Applica
     )
 
 
-def type_text_via_clipboard(text: str) -> None:
+def set_file_name(dialog, path: str) -> None:
+    """
+    Enter a path in a Save As or Open dialog's file name field.
+
+    Writes the edit control through IValueProvider, so nothing goes through
+    the keyboard or clipboard; falls back to typing the path after Alt+N.
+
+    Args:
+        dialog: UIA window specification of the file dialog.
+        path: Full path to enter.
     """
-    Type text by copying to clipboard and pasting.
-    This handles special characters and paths correctly.
+    # The file name edit has a fixed auto_id; otherwise use the first edit
+    for criteria in ({'auto_id': "1001"}, {'found_index': 0}):
+        try:
+            edit = dialog.child_window(control_type="Edit", **criteria).wrapper_object()
+            edit.set_edit_text(path)
+            return
+        except _CONTROL_ERRORS:
+            pass
+
+    # Alt+N (common shortcut for filename field), select all existing text
+    # and type the path, escaping characters send_keys treats as modifiers
+    time.sleep(0.5)
+    ensure_foreground(dialog)
+    send_keys('%n^a' + _SEND_KEYS_SPECIAL_RE.sub(r'{\1}', path), with_spaces=True, pause=0)
+    time.sleep(0.5)
+
+
+def select_pbip_file_type(dialog) -> None:
+    """
+    Change the Save As dialog's file type to PBIP.
+
+    Selects the PBIP entry of the file type combo box through UIA; falls back
+    to keyboard navigation of the dropdown.
 
     Args:
-        text: The text to type.
+        dialog: UIA window specification of the Save As dialog.
     """
-    old_clipboard = None
     try:
-        old_clipboard = pyperclip.paste()
-    except Exception:
+        combo = dialog.child_window(
+            control_type="ComboBox", auto_id="FileTypeControlHost"
+        ).wrapper_object()
+        pbip_type = next((text for text in combo.texts() if "*.pbip" in text.lower()), None)
+        if pbip_type is not None:
+            combo.select(pbip_type)
+            return
+    except _CONTROL_ERRORS:
         pass
 
-    pyperclip.copy(text)
-    time.sleep(0.1)
-    pyautogui.hotkey('ctrl', 'v')
-    time.sleep(0.3)
+    # Try Alt+T for file type dropdown
+    ensure_foreground(dialog)
+    send_keys('%t', pause=0)
+    time.sleep(0.5)
 
-    # Restore old clipboard content
-    if old_clipboard is not None:
-        try:
-            pyperclip.copy(old_clipboard)
-        except Exception:
-            pass
+    # Navigate dropdown - press Home to go to top, then arrow down to
+    # find PBIP (it's usually near the bottom; Power BI typically has
+    # PBIX, PBIT, PBIP), or type 'p' to cycle through P options
+    ensure_foreground(dialog)
+    send_keys('{HOME}{DOWN 5}ppp{ENTER}', pause=0)
+    time.sleep(0.5)
 
 
-def wait_for_save_dialog(timeout: int = DIALOG_TIMEOUT) -> bool:
+def click_dialog_button(dialog, title: str, keys: str) -> None:
     """
-    Wait for a Save As dialog to appear.
+    Press a button in a file dialog.
+
+    Invokes the button's IInvokeProvider; falls back to sending keys.
 
     Args:
+        dialog: UIA window specification of the file dialog.
+        title: Title of the button (e.g. "Save").
+        keys: send_keys sequence that presses the button from the keyboard.
+    """
+    try:
+        dialog.child_window(control_type="Button", title=title).wrapper_object().invoke()
+        return
+    except _CONTROL_ERRORS:
+        pass
+
+    ensure_foreground(dialog)
+    send_keys(keys, pause=0)
+
+
+def wait_for_file_dialog(title_re: re.Pattern, timeout: int = DIALOG_TIMEOUT, parent=None):
+    """
+    Wait for a file dialog (Save As, Open) to appear.
+
+    Args:
+        title_re: Compiled pattern matching the dialog title.
         timeout: Maximum seconds to wait.
+        parent: Optional UIA wrapper of the main window. When given, the
+            search is scoped to its descendants instead of the whole desktop.
 
     Returns:
-        True if dialog found, False otherwise.
+        UIA window specification bound to the dialog's handle if found, so
+        its controls can be looked up with child_window(); None otherwise.
     """
     start_time = time.time()
-    while time.time() - start_time < timeout:
-        try:
+    with WindowWatcher(title_re.match) as watcher:
+        while time.time() - start_time < timeout:
             desktop = Desktop(backend='uia')
-            # Look for common Save dialog titles
-            for title_pattern in ["Save As", "Save as", "Save"]:
+            scope = {}
+            if parent is not None:
+                scope = {'parent': parent, 'top_level_only': False}
+
+            # Control type and class name are filtered natively inside
+            # UIAutomationCore, so try the standard dialog class first and
+            # only fall back to matching on the title text. Message boxes
+            # share the dialog class, so the title is checked either way.
+            for criteria in (
+                {'class_name': SAVE_DIALOG_CLASS, 'found_index': 0},
+                {'title_re': title_re},
+            ):
                 try:
-                    dialog = desktop.window(title=title_pattern)
-                    if dialog.exists() and dialog.is_visible():
-                        return True
-                except ElementNotFoundError:
+                    dialog = desktop.window(
+                        control_type="Window", **scope, **criteria
+                    ).wrapper_object()
+                    if dialog.element_info.visible and title_re.match(dialog.window_text()):
+                        return desktop.window(handle=dialog.handle)
+                except Exception:
                     pass
 
-            # Also try regex pattern
-            try:
-                dialog = desktop.window(title_re=".*Save.*")
-                if dialog.exists() and dialog.is_visible():
-                    return True
-            except ElementNotFoundError:
-                pass
-
-        except Exception:
-            pass
+            # Returns early as soon as a matching window is shown
+            watcher.wait(DIALOG_POLL_INTERVAL)
 
-        time.sleep(0.5)
-
-    return False
+    return None
 
 
-def save_as_pbip(app: Application, output_folder: str, project_name: str) -> Tuple[bool, str]:
+def wait_for_save_dialog(timeout: int = DIALOG_TIMEOUT, parent=None):
     """
-    Automate the Save As dialog to save current file as PBIP.
+    Wait for a Save As dialog to appear.
 
     Args:
-        app: pywinauto Application connected to Power BI Desktop.
-        output_folder: Directory where the PBIP project should be saved.
-        project_name: Name for the PBIP project (without extension).
+        timeout: Maximum seconds to wait.
+        parent: Optional UIA wrapper of the main window to scope the search to.
 
     Returns:
-        Tuple of (success: bool, message: str).
+        UIA window specification of the dialog if found, None otherwise.
     """
+    return wait_for_file_dialog(_SAVE_DIALOG_RE, timeout=timeout, parent=parent)
+
+
+def _project_paths(output_folder: str, project_name: str) -> Tuple[str, str, str]:
+    """Return the .pbip file, .Report and .SemanticModel folder of a PBIP project."""
+    return (
+        os.path.join(output_folder, f"{project_name}.pbip"),
+        os.path.join(output_folder, f"{project_name}.Report"),
+        os.path.join(output_folder, f"{project_name}.SemanticModel"),
+    )
+
+
+def _mtime_ns(path: str) -> Optional[int]:
+    """Return a path's modification time in nanoseconds, or None if it doesn't exist."""
     try:
-        # Get the main window and ensure it has focus
-        main_window = app.top_window()
-        main_window.set_focus()
-        time.sleep(1)
-
-        # Try Ctrl+Shift+S first (standard Save As shortcut)
-        print("    Attempting Save As with Ctrl+Shift+S...")
-        pyautogui.hotkey('ctrl', 'shift', 's')
-        time.sleep(2)
-
-        # Check if Save As dialog appeared
-        if not wait_for_save_dialog(timeout=5):
-            # Fallback: Try File menu approach
-            print("    Ctrl+Shift+S didn't work, trying File menu...")
-            main_window.set_focus()
-            time.sleep(0.5)
-
-            # Open File menu
-            pyautogui.hotkey('alt', 'f')
-            time.sleep(1.5)
-
-            # In Power BI, Save As is typically the 'a' accelerator key
-            pyautogui.press('a')
-            time.sleep(2)
-
-            # If still no dialog, try navigating with arrows
-            if not wait_for_save_dialog(timeout=3):
-                print("    Trying arrow key navigation...")
-                main_window.set_focus()
-                pyautogui.hotkey('alt', 'f')
-                time.sleep(1)
-
-                # Navigate down to Save As option
-                for _ in range(5):
-                    pyautogui.press('down')
-                    time.sleep(0.2)
-                pyautogui.press('enter')
-                time.sleep(2)
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
 
-        # Final check for Save dialog
-        if not wait_for_save_dialog(timeout=5):
-            return False, "Could not open Save As dialog"
 
-        print("    Save As dialog opened, entering file details...")
+def snapshot_project(output_folder: str, project_name: str) -> dict:
+    """
+    Record the modification times of a PBIP project's files.
+
+    Taken before saving, so wait_for_save_output can tell a new save from
+    the output of an earlier conversion of the same file.
 
-        # Prepare the output path
-        output_path = os.path.join(os.path.abspath(output_folder), project_name)
+    Args:
+        output_folder: Directory the PBIP project is saved to.
+        project_name: Name of the PBIP project (without extension).
 
-        # Focus on filename field - try multiple methods
-        time.sleep(0.5)
+    Returns:
+        Dictionary mapping each project path to its mtime, or None if missing.
+    """
+    return {path: _mtime_ns(path) for path in _project_paths(output_folder, project_name)}
+
+
+def wait_for_save_output(
+    output_folder: str,
+    project_name: str,
+    timeout: int = SAVE_TIMEOUT,
+    stop: Optional[threading.Event] = None,
+    before: Optional[dict] = None
+) -> bool:
+    """
+    Wait for Power BI Desktop to write the PBIP project to the output folder.
 
-        # Method 1: Alt+N (common shortcut for filename field)
-        pyautogui.hotkey('alt', 'n')
-        time.sleep(0.3)
+    Blocks on a directory change notification and checks the project files
+    when an entry in the folder is created, renamed or written, and at least
+    once a second. Falls back to polling once a second if the notification
+    can't be set up.
 
-        # Select all existing text and replace with our path
-        pyautogui.hotkey('ctrl', 'a')
-        time.sleep(0.2)
+    Args:
+        output_folder: Directory the PBIP project is being saved to.
+        project_name: Name of the PBIP project (without extension).
+        timeout: Maximum seconds to wait.
+        stop: Optional event that ends the wait early when set.
+        before: Snapshot from snapshot_project() taken before saving. Project
+            files that already existed only count once they have changed.
 
-        # Use clipboard to paste the path (handles special characters)
-        type_text_via_clipboard(output_path)
-        time.sleep(0.5)
+    Returns:
+        True if the project files were written, False on timeout.
+    """
+    paths = _project_paths(output_folder, project_name)
+    pbip_file = paths[0]
+    before = before or {}
+
+    def changed(path: str) -> bool:
+        mtime = _mtime_ns(path)
+        return mtime is not None and mtime != before.get(path)
+
+    def project_written() -> bool:
+        return any(changed(path) for path in paths)
+
+    kernel32 = ctypes.windll.kernel32
+    kernel32.FindFirstChangeNotificationW.restype = wintypes.HANDLE
+    handle = kernel32.FindFirstChangeNotificationW(
+        os.path.abspath(output_folder),
+        False,
+        FILE_NOTIFY_CHANGE_FILE_NAME | FILE_NOTIFY_CHANGE_DIR_NAME | FILE_NOTIFY_CHANGE_LAST_WRITE
+    )
 
-        # Change file type to PBIP
-        print("    Selecting PBIP file type...")
+    def stopped() -> bool:
+        return stop is not None and stop.is_set()
 
-        # Try Alt+T for file type dropdown
-        pyautogui.hotkey('alt', 't')
-        time.sleep(0.5)
+    if not handle or handle == INVALID_HANDLE_VALUE:
+        wait_until(lambda: stopped() or project_written(), timeout=timeout, interval=1)
+        found = project_written()
+    else:
+        try:
+            deadline = time.perf_counter() + timeout
+            found = project_written()
+            while not found and not stopped():
+                remaining_ms = int((deadline - time.perf_counter()) * 1000)
+                if remaining_ms <= 0:
+                    break
+                result = kernel32.WaitForSingleObject(
+                    handle, min(remaining_ms, SAVE_WAIT_SLICE * 1000)
+                )
+                if result not in (WAIT_OBJECT_0, WAIT_TIMEOUT):
+                    break
+                # Also checked on a timeout, as changes inside the project
+                # subfolders aren't reported for the output folder
+                found = project_written()
+                if result == WAIT_OBJECT_0:
+                    kernel32.FindNextChangeNotification(handle)
+            found = found or project_written()
+        finally:
+            kernel32.FindCloseChangeNotification(handle)
 
-        # Navigate dropdown - press Home to go to top, then find PBIP
-        pyautogui.press('home')
-        time.sleep(0.2)
+    if found and not stopped() and not changed(pbip_file):
+        # Give a bit more time for all files to be written
+        wait_until(lambda: changed(pbip_file), timeout=2)
 
-        # Arrow down to find PBIP option (it's usually near the bottom)
-        # Power BI typically has: PBIX, PBIT, PBIP
-        for _ in range(5):
-            pyautogui.press('down')
-            time.sleep(0.2)
+    return found
 
-        # Or try typing 'p' multiple times to cycle through P options
-        pyautogui.press('p')
-        time.sleep(0.2)
-        pyautogui.press('p')
-        time.sleep(0.2)
-        pyautogui.press('p')
-        time.sleep(0.3)
 
-        pyautogui.press('enter')
-        time.sleep(0.5)
+def save_as_pbip(app: Application, output_folder: str, project_name: str) -> Tuple[bool, str]:
+    """
+    Automate the Save As dialog to save current file as PBIP.
 
-        # Click Save button
-        print("    Clicking Save...")
-        pyautogui.hotkey('alt', 's')
-        time.sleep(3)
+    Args:
+        app: pywinauto Application connected to Power BI Desktop.
+        output_folder: Directory where the PBIP project should be saved.
+        project_name: Name for the PBIP project (without extension).
 
-        # Wait for save operation to complete
+    Returns:
+        Tuple of (success: bool, message: str).
+    """
+    try:
+        # Keyboard and focus driven steps; serialized across parallel workers
+        with exclusive_input():
+            # Get the main window; ensure_foreground gives it focus before
+            # each keystroke. The wrapper is resolved once and reused as the
+            # parent for the dialog searches.
+            main_window = get_main_wrapper(app)
+
+            # Try Ctrl+Shift+S first (standard Save As shortcut)
+            print("    Attempting Save As with Ctrl+Shift+S...")
+            ensure_foreground(main_window)
+            send_keys('^+s', pause=0)
+
+            # Check if Save As dialog appeared. The dialog is only used once,
+            # so the wrapper from whichever wait finds it is kept as is
+            dialog = wait_for_save_dialog(timeout=5, parent=main_window)
+            if dialog is None:
+                # Fallback: Try File menu approach
+                print("    Ctrl+Shift+S didn't work, trying File menu...")
+
+                # Open File menu
+                ensure_foreground(main_window)
+                send_keys('%f', pause=0)
+                time.sleep(1.5)
+
+                # In Power BI, Save As is typically the 'a' accelerator key
+                ensure_foreground(main_window)
+                send_keys('a', pause=0)
+
+                # If still no dialog, try navigating with arrows
+                dialog = wait_for_save_dialog(timeout=3, parent=main_window)
+                if dialog is None:
+                    print("    Trying arrow key navigation...")
+                    ensure_foreground(main_window)
+                    send_keys('%f', pause=0)
+                    time.sleep(1)
+
+                    # Navigate down to Save As option
+                    ensure_foreground(main_window)
+                    send_keys('{DOWN 5}{ENTER}', pause=0)
+
+                    # Final check for Save dialog
+                    dialog = wait_for_save_dialog(timeout=5, parent=main_window)
+
+            if dialog is None:
+                return False, "Could not open Save As dialog"
+
+            print("    Save As dialog opened, entering file details...")
+
+            # Prepare the output path
+            output_path = os.path.join(os.path.abspath(output_folder), project_name)
+
+            # Set the file name, file type and click Save through the UIA control
+            # patterns, falling back to keyboard input where a pattern fails
+            set_file_name(dialog, output_path)
+
+            print("    Selecting PBIP file type...")
+            select_pbip_file_type(dialog)
+
+            # Output of an earlier conversion may still be there; only
+            # files written from here on count as a successful save
+            before = snapshot_project(output_folder, project_name)
+
+            print("    Clicking Save...")
+            click_dialog_button(dialog, "Save", '%s')
+
+            # Re-converting a changed file saves over the earlier output;
+            # accept the overwrite prompt
+            if any(mtime is not None for mtime in before.values()):
+                confirm = wait_for_file_dialog(_CONFIRM_SAVE_RE, timeout=3, parent=main_window)
+                if confirm is not None:
+                    print("    Replacing the earlier output...")
+                    click_dialog_button(confirm, "Yes", '%y')
+
+        # Wait for save operation to complete. The wait runs on a separate,
+        # higher priority thread so it isn't held up behind input handling.
         print("    Waiting for save to complete...")
-        save_start = time.time()
-        while time.time() - save_start < SAVE_TIMEOUT:
-            # Check if the PBIP file or folders exist
-            pbip_file = os.path.join(output_folder, f"{project_name}.pbip")
-            report_folder = os.path.join(output_folder, f"{project_name}.Report")
-            model_folder = os.path.join(output_folder, f"{project_name}.SemanticModel")
-
-            if os.path.exists(pbip_file):
-                return True, f"Successfully saved to {output_folder}"
-            if os.path.exists(report_folder) or os.path.exists(model_folder):
-                # Give a bit more time for all files to be written
-                time.sleep(2)
-                return True, f"Successfully saved to {output_folder}"
-
-            time.sleep(1)
-
-        # Final verification
-        pbip_file = os.path.join(output_folder, f"{project_name}.pbip")
-        if os.path.exists(pbip_file):
-            return True, f"Successfully saved to {output_folder}"
+        done = threading.Event()
+        stop = threading.Event()
+        outcome = []
 
-        report_folder = os.path.join(output_folder, f"{project_name}.Report")
-        model_folder = os.path.join(output_folder, f"{project_name}.SemanticModel")
-        if os.path.exists(report_folder) or os.path.exists(model_folder):
+        def wait_for_save():
+            _raise_thread_priority()
+            try:
+                outcome.append(
+                    wait_for_save_output(output_folder, project_name, stop=stop, before=before)
+                )
+            finally:
+                done.set()
+
+        # A daemon thread, so an interrupted run can exit without joining it
+        threading.Thread(target=wait_for_save, daemon=True).start()
+        try:
+            # wait_for_save_output enforces SAVE_TIMEOUT itself; the margin
+            # covers its final settle wait. Waiting in slices keeps Ctrl+C
+            # responsive on Windows.
+            deadline = time.perf_counter() + SAVE_TIMEOUT + 5
+            while not done.wait(SAVE_WAIT_SLICE) and time.perf_counter() < deadline:
+                pass
+        finally:
+            stop.set()
+        saved = bool(outcome and outcome[0])
+
+        if saved:
             return True, f"Successfully saved to {output_folder}"
 
         return False, "Save operation may have failed - output files not found"
@@ -385,112 +1069,411 @@ def close_pbi_desktop(app: Application = None, force: bool = False) -> bool:
     if force:
         return kill_pbi_desktop()
 
+    main_window = None
     try:
+        # Enumerated once; the waits below only check these processes
+        processes = _find_pbi_pids()
+
         if app:
-            main_window = app.top_window()
-            main_window.set_focus()
-            time.sleep(0.3)
+            main_window = get_main_wrapper(app)
+            ensure_foreground(main_window, timeout=0.3)
 
         # Try Alt+F4
         pyautogui.hotkey('alt', 'F4')
-        time.sleep(2)
 
         # Handle "Don't Save" dialog if it appears
         try:
             desktop = Desktop(backend='uia')
             # Look for save prompt dialog
-            for _ in range(5):
-                try:
-                    dialog = desktop.window(title_re=".*Power BI Desktop.*")
-                    if dialog.exists():
-                        # Try to find "Don't Save" or "No" button
-                        pyautogui.press('tab')  # Navigate to Don't Save
-                        pyautogui.press('enter')
-                        break
-                except ElementNotFoundError:
-                    break
-                time.sleep(0.5)
+            if main_window is not None:
+                # The prompt is owned by the main window, so only
+                # search its descendants
+                dialog = desktop.window(
+                    parent=main_window,
+                    title_re=_MAIN_WINDOW_RE,
+                    top_level_only=False,
+                    control_type="Window"
+                )
+            else:
+                dialog = desktop.window(title_re=_MAIN_WINDOW_RE)
+
+            # Stop waiting as soon as the prompt shows up or PBI has exited
+            wait_until(
+                lambda: dialog.exists(timeout=0)
+                or not any(proc.is_running() for proc in processes),
+                timeout=4.5,
+                interval=0.25
+            )
+            if dialog.exists(timeout=0):
+                # Try to find "Don't Save" or "No" button
+                pyautogui.press('tab')  # Navigate to Don't Save
+                pyautogui.press('enter')
         except Exception:
             pass
 
-        time.sleep(2)
+        # Returns as soon as all of them have exited
+        _, remaining = psutil.wait_procs(processes, timeout=2)
 
         # Verify it's closed
-        if not is_pbi_desktop_running():
+        _invalidate_running_cache()
+        if not remaining:
             return True
 
         # Force kill if still running
-        return kill_pbi_desktop()
+        return kill_pbi_desktop(remaining)
 
     except Exception:
         return kill_pbi_desktop()
 
 
-def convert_pbix_to_pbip(
-    pbix_path: str,
-    output_folder: str,
-    project_name: Optional[str] = None
-) -> Tuple[bool, str]:
+def open_pbix_in_session(app: Application, pbix_path: str) -> bool:
     """
-    Convert a PBIX file to PBIP format.
+    Open another PBIX file in an already running Power BI Desktop.
 
-    This is the main function that orchestrates the entire conversion process.
+    Uses File > Open (Ctrl+O) instead of starting a new process, so the
+    Power BI Desktop startup cost is only paid once per batch.
 
     Args:
-        pbix_path: Path to the source PBIX file.
-        output_folder: Directory where the PBIP project should be saved.
-        project_name: Optional name for the project. If None, uses PBIX filename.
+        app: pywinauto Application connected to Power BI Desktop.
+        pbix_path: Full path to the PBIX file.
 
     Returns:
-        Tuple of (success: bool, message: str).
+        True if the file was submitted in the Open dialog, False otherwise.
+    """
+    abs_path = os.path.abspath(pbix_path)
+
+    main_window = get_main_wrapper(app)
+    old_title = main_window.window_text()
+
+    ensure_foreground(main_window)
+    send_keys('^o', pause=0)
+    dialog = wait_for_file_dialog(_OPEN_DIALOG_RE, timeout=10, parent=main_window)
+    if dialog is None:
+        return False
+
+    set_file_name(dialog, abs_path)
+    click_dialog_button(dialog, "Open", '{ENTER}')
+
+    # Wait for the previous report to be replaced before looking for the new
+    # one, so a title that contains the next file name isn't mistaken for it
+    return wait_until(
+        lambda: main_window.window_text() != old_title,
+        timeout=DIALOG_TIMEOUT,
+        interval=0.25
+    )
+
+
+def _close_session(app: Optional[Application], owned_pids: set) -> None:
+    """
+    Force close the Power BI Desktop instance of a conversion session.
+
+    In a parallel worker only the instances the session started are killed;
+    otherwise every Power BI Desktop process is.
+
+    Args:
+        app: pywinauto Application of the session, if connected.
+        owned_pids: PIDs of the instances started by the session and the
+            descendants found so far.
+    """
+    if _input_lock is None:
+        close_pbi_desktop(app, force=True)
+    else:
+        kill_pbi_desktop(_find_pbi_pids(owned_pids))
+
+
+def _convert_session(
+    jobs: List[Tuple[str, str, str]],
+    pbi_path: Optional[str] = None,
+    output_exists: bool = False
+) -> Iterator[Tuple[bool, str]]:
+    """
+    Convert PBIX files one after another in a single Power BI Desktop session.
+
+    Args:
+        jobs: List of (pbix_path, output_folder, project_name) tuples.
+        pbi_path: Path to PBIDesktop.exe if already resolved by the caller.
+        output_exists: True if the caller has already created the output folders.
+
+    Yields:
+        Tuple of (success: bool, message: str) for each job, in order.
     """
     # Find Power BI Desktop
-    pbi_exe = find_pbi_desktop()
+    pbi_exe = pbi_path or find_pbi_desktop()
+    if pbi_exe and not os.path.exists(pbi_exe):
+        # Cached path has gone away (e.g. uninstalled or updated)
+        find_pbi_desktop.cache_clear()
+        pbi_exe = find_pbi_desktop()
     if not pbi_exe:
-        return False, (
-            "Power BI Desktop not found. Please ensure it is installed.\n"
-            "Download from: https://powerbi.microsoft.com/desktop/"
-        )
+        for _ in jobs:
+            yield False, (
+                "Power BI Desktop not found. Please ensure it is installed.\n"
+                "Download from: https://powerbi.microsoft.com/desktop/"
+            )
+        return
+
+    # Check if PBI Desktop is already running. Parallel workers skip this,
+    # as the other workers' instances are expected to be running.
+    if _input_lock is None and is_pbi_desktop_running():
+        for _ in jobs:
+            yield False, (
+                "Power BI Desktop is already running. "
+                "Please close it before starting the conversion."
+            )
+        return
 
-    # Check if PBI Desktop is already running
-    if is_pbi_desktop_running():
-        return False, (
-            "Power BI Desktop is already running. "
-            "Please close it before starting the conversion."
-        )
+    app = None
+    # PIDs of the instances started by this session
+    owned_pids = set()
 
-    # Determine project name
-    if project_name is None:
+    try:
+        # Keep the 1 ms timer resolution for the whole session
+        with high_resolution_timer():
+            for pbix_path, output_folder, project_name in jobs:
+                abs_path = os.path.abspath(pbix_path)
+                if not os.path.exists(abs_path):
+                    yield False, f"PBIX file not found: {abs_path}"
+                    continue
+
+                # Create output folder if needed
+                if not output_exists:
+                    os.makedirs(output_folder, exist_ok=True)
+
+                try:
+                    # Reuse the running instance if there is one; start a new
+                    # one if there isn't or the file can't be opened in it
+                    reused = False
+                    if app is not None:
+                        with exclusive_input():
+                            reused = open_pbix_in_session(app, pbix_path)
+                    if not reused:
+                        if app is not None:
+                            _close_session(app, owned_pids)
+                            app = None
+                        owned_pids.add(open_pbix(pbix_path, pbi_exe))
+
+                    # Wait for PBI Desktop to fully load
+                    # A parallel worker only accepts its own instances;
+                    # other workers' windows can have matching titles
+                    app = wait_for_pbi_ready(
+                        pbix_path,
+                        owned_pids=owned_pids if _input_lock is not None else None
+                    )
+                    owned_pids.add(app.process)
+
+                    # Perform the Save As operation
+                    success, message = save_as_pbip(app, output_folder, project_name)
+
+                except PBIAutomationError as e:
+                    success, message = False, str(e)
+                except Exception as e:
+                    success, message = False, f"Unexpected error: {str(e)}"
+
+                if not success:
+                    # The UI is in an unknown state; start fresh for the next file
+                    _close_session(app, owned_pids)
+                    app = None
+
+                yield success, message
+
+    finally:
+        # Always try to close PBI Desktop
+        _close_session(app, owned_pids)
+
+
+def _jobs_for(pbix_paths: List[str], output_folder: str) -> List[Tuple[str, str, str]]:
+    """Build (pbix_path, output_folder, project_name) jobs, one subfolder per file."""
+    jobs = []
+    for pbix_path in pbix_paths:
         project_name = Path(pbix_path).stem
+        jobs.append((pbix_path, os.path.join(output_folder, project_name), project_name))
+    return jobs
 
-    # Create output folder if needed
-    os.makedirs(output_folder, exist_ok=True)
 
-    app = None
-    process = None
+def iter_convert_batch(
+    jobs: List[Tuple[str, str, str]],
+    pbi_path: Optional[str] = None,
+    output_exists: bool = False
+) -> Iterator[Tuple[bool, str]]:
+    """
+    Convert PBIX files in a single PBI Desktop session, yielding as each finishes.
 
-    try:
-        # Open the PBIX file
-        process = open_pbix(pbix_path, pbi_exe)
+    Power BI Desktop is started once and each following file is opened in
+    the running instance, falling back to a restart if that fails. It is
+    closed once the generator is exhausted or closed.
 
-        # Wait for PBI Desktop to fully load
-        app = wait_for_pbi_ready(pbix_path)
+    Args:
+        jobs: List of (pbix_path, output_folder, project_name) tuples.
+        pbi_path: Path to PBIDesktop.exe if already resolved by the caller.
+        output_exists: True if the caller has already created the output folders.
 
-        # Perform the Save As operation
-        success, message = save_as_pbip(app, output_folder, project_name)
+    Yields:
+        Tuple of (success: bool, message: str) for each job, in order.
+    """
+    return _convert_session(jobs, pbi_path, output_exists)
 
-        return success, message
 
-    except PBIAutomationError as e:
-        return False, str(e)
-    except Exception as e:
-        return False, f"Unexpected error: {str(e)}"
-    finally:
-        # Always try to close PBI Desktop
-        close_pbi_desktop(app, force=True)
+def convert_pbix_batch(pbix_paths: List[str], output_folder: str) -> List[Tuple[bool, str]]:
+    """
+    Convert several PBIX files to PBIP format in a single PBI Desktop session.
+
+    Power BI Desktop is started once and each following file is opened in
+    the running instance, falling back to a restart if that fails.
+
+    Args:
+        pbix_paths: Paths to the source PBIX files.
+        output_folder: Base directory. Each project is saved to a subfolder
+            named after its PBIX file.
+
+    Returns:
+        List of (success: bool, message: str) tuples, one per input file.
+    """
+    return list(iter_convert_batch(_jobs_for(pbix_paths, output_folder)))
+
+
+def _init_parallel_worker(input_lock) -> None:
+    """Initialize a convert_pbix_parallel worker process."""
+    global _input_lock
+    _input_lock = input_lock
+
+
+def _convert_parallel_job(
+    job: Tuple[str, str, str],
+    pbi_path: Optional[str] = None
+) -> Tuple[bool, str, str]:
+    """
+    Convert a single job inside a convert_pbix_parallel worker.
+
+    The output folder is created by iter_convert_parallel before the job is
+    submitted.
+
+    Returns:
+        Tuple of (success, message, captured progress output).
+    """
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        success, message = list(_convert_session([job], pbi_path, output_exists=True))[0]
+    return success, message, output.getvalue()
+
+
+def iter_convert_parallel(
+    jobs: List[Tuple[str, str, str]],
+    workers: int = 2,
+    pbi_path: Optional[str] = None
+) -> Iterator[Tuple[int, bool, str, str]]:
+    """
+    Convert PBIX files with concurrent PBI Desktop instances, yielding as each finishes.
 
-        if process:
+    Each worker process opens its own Power BI Desktop instance, so the slow
+    file loads overlap. Keyboard input only reaches the active desktop, so
+    the short Save As interaction is serialized across workers with a shared
+    lock. Each worker only kills the instances it started. If the generator
+    is closed early, jobs that haven't started yet are cancelled.
+
+    Args:
+        jobs: List of (pbix_path, output_folder, project_name) tuples.
+        workers: Number of concurrent Power BI Desktop instances. Each can use
+            around 2 GB of memory, so keep this small.
+        pbi_path: Path to PBIDesktop.exe if already resolved by the caller.
+
+    Yields:
+        Tuple of (job index, success, message, captured progress output),
+        in completion order.
+    """
+    # Workers don't check this themselves, since they expect each other's
+    # instances to be running
+    if is_pbi_desktop_running():
+        for index in range(len(jobs)):
+            yield index, False, (
+                "Power BI Desktop is already running. "
+                "Please close it before starting the conversion."
+            ), ""
+        return
+
+    # Create the output folders here rather than racing in the workers
+    for _, output_folder, _ in jobs:
+        os.makedirs(output_folder, exist_ok=True)
+
+    input_lock = multiprocessing.Lock()
+
+    executor = ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_parallel_worker,
+        initargs=(input_lock,)
+    )
+    try:
+        futures = {
+            executor.submit(_convert_parallel_job, job, pbi_path): index
+            for index, job in enumerate(jobs)
+        }
+        for future in as_completed(futures):
             try:
-                process.terminate()
-            except Exception:
-                pass
+                success, message, output = future.result()
+            except Exception as e:
+                success, message, output = False, f"Unexpected error: {str(e)}", ""
+            yield futures[future], success, message, output
+    finally:
+        # If the caller stops early (e.g. on Ctrl+C), drop the jobs that
+        # haven't started instead of running them all before returning
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def convert_pbix_parallel(
+    pbix_paths: List[str],
+    output_folder: str,
+    workers: int = 2
+) -> List[Tuple[bool, str]]:
+    """
+    Convert several PBIX files to PBIP format with concurrent PBI Desktop instances.
+
+    See iter_convert_parallel for how the instances are coordinated.
+
+    Args:
+        pbix_paths: Paths to the source PBIX files.
+        output_folder: Base directory. Each project is saved to a subfolder
+            named after its PBIX file.
+        workers: Number of concurrent Power BI Desktop instances.
+
+    Returns:
+        List of (success: bool, message: str) tuples, one per input file.
+    """
+    jobs = _jobs_for(pbix_paths, output_folder)
+    results = [None] * len(jobs)
+
+    for index, success, message, output in iter_convert_parallel(jobs, workers):
+        # Print each worker's progress in one piece once its job finishes
+        sys.stdout.write(output)
+        results[index] = (success, message)
+
+    return results
+
+
+def convert_pbix_to_pbip(
+    pbix_path: str,
+    output_folder: str,
+    project_name: Optional[str] = None,
+    pbi_path: Optional[str] = None,
+    output_exists: bool = False
+) -> Tuple[bool, str]:
+    """
+    Convert a PBIX file to PBIP format.
+
+    This is the main function that orchestrates the entire conversion process.
+
+    Args:
+        pbix_path: Path to the source PBIX file.
+        output_folder: Directory where the PBIP project should be saved.
+        project_name: Optional name for the project. If None, uses PBIX filename.
+        pbi_path: Optional path to PBIDesktop.exe, e.g. from an earlier
+            find_pbi_desktop() call. If None, it is looked up.
+        output_exists: True if output_folder has already been created, so
+            it isn't checked again.
+
+    Returns:
+        Tuple of (success: bool, message: str).
+    """
+    # Determine project name
+    if project_name is None:
+        project_name = Path(pbix_path).stem
+
+    job = (pbix_path, output_folder, project_name)
+    return list(_convert_session([job], pbi_path, output_exists))[0]
@@ -6,20 +6,34 @@ A console application that converts Microsoft Power BI PBIX files to PBIP
 (Power BI Project) format by automating Power BI Desktop.
 
 Usage:
-    python pbix_converter.py [directory]
+    python pbix_converter.py [directory] [options]
+
+Run with --help for the list of options.
 
 If no directory is specified, the current working directory is used.
 """
 
+import argparse
+import contextlib
+import hashlib
+import io
+import itertools
+import json
 import os
+import re
+import shutil
 import sys
+import time
+from collections import deque
+from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterator, List, NamedTuple, Optional, Tuple
 
 from pbi_automation import (
     find_pbi_desktop,
     is_pbi_desktop_running,
-    convert_pbix_to_pbip,
+    iter_convert_batch,
+    iter_convert_parallel,
     kill_pbi_desktop,
 )
 
@@ -27,6 +41,42 @@ from pbi_automation import (
 # Output folder name
 OUTPUT_FOLDER_NAME = "pbip_output"
 
+# PBIX file extension, matched case-insensitively
+PBIX_SUFFIX = ".pbix"
+
+# Conversion cache, kept in the output folder
+CACHE_FILE_NAME = ".pbix_cache.json"
+
+# Bytes hashed from each end of a PBIX file for --verify
+HASH_SAMPLE_SIZE = 1024 * 1024
+
+# Number of recent conversions averaged for the progress line's ETA
+PROGRESS_WINDOW = 10
+
+# A file number or range of numbers in a selection, e.g. "3" or "5-7"
+_NUM_RE = re.compile(r'(\d+)(?:\s*-\s*(\d+))?')
+
+# Maximum number of files listed by display_files
+MAX_DISPLAY = 50
+
+# Default number of concurrent Power BI Desktop instances. Files are
+# converted one at a time unless --workers asks for more.
+DEFAULT_WORKERS = 1
+
+# Most worker processes ProcessPoolExecutor accepts on Windows
+MAX_WORKERS = 61
+
+# Power BI Desktop executable resolved by check_prerequisites()
+_PBI_PATH: Optional[str] = None
+
+
+class RunAborted(Exception):
+    """Raised by run() when it stops before converting any files."""
+
+    def __init__(self, reason: str, exit_code: int):
+        super().__init__(reason)
+        self.exit_code = exit_code
+
 
 def print_header():
     """Print the application header."""
@@ -37,7 +87,43 @@ def print_header():
     print()
 
 
-def find_pbix_files(directory: str) -> List[Path]:
+class PbixEntry(NamedTuple):
+    """A PBIX file found in the working directory."""
+    path: Path
+    size: int
+
+
+def iter_pbix_files(directory: str) -> Iterator[PbixEntry]:
+    """
+    Lazily yield the PBIX files in the specified directory, in listing order.
+
+    Uses os.scandir so the file type and size come from the directory
+    listing itself, without a separate stat call per file. The
+    OUTPUT_FOLDER_NAME entry is skipped. The extension is matched
+    case-insensitively, so .PBIX files are found on case-sensitive file
+    systems too.
+
+    Args:
+        directory: Directory to search.
+
+    Yields:
+        PbixEntry tuples for found PBIX files.
+    """
+    with os.scandir(directory) as it:
+        for entry in it:
+            # Never pick up anything from our own generated output
+            if entry.name == OUTPUT_FOLDER_NAME:
+                continue
+            # Only lowercase the extension, not the whole name
+            name = entry.name
+            if (
+                name[-len(PBIX_SUFFIX):].lower() == PBIX_SUFFIX
+                and entry.is_file(follow_symlinks=False)
+            ):
+                yield PbixEntry(Path(entry.path), entry.stat().st_size)
+
+
+def find_pbix_files(directory: str) -> List[PbixEntry]:
     """
     Find all PBIX files in the specified directory.
 
@@ -45,23 +131,56 @@ def find_pbix_files(directory: str) -> List[Path]:
         directory: Directory to search.
 
     Returns:
-        List of Path objects for found PBIX files.
+        List of PbixEntry tuples for found PBIX files, sorted by name.
     """
-    dir_path = Path(directory)
-    return sorted(dir_path.glob("*.pbix"))
+    # Compare the paths rather than the name strings: Windows paths compare
+    # case-insensitively, which keeps the numbering used by --select stable
+    return sorted(iter_pbix_files(directory), key=lambda e: e.path)
+
+
+def display_files(files: List[PbixEntry]) -> None:
+    """Display the list of found PBIX files, up to MAX_DISPLAY of them."""
+    # Build the listing and write it in one call rather than a print per file
+    fmt = "  {i}. {name} ({mb:.1f} MB)".format
+    lines = [f"Found {len(files)} PBIX file(s):", ""]
+    lines += [
+        fmt(i=i, name=f.path.name, mb=f.size / (1024 * 1024))
+        for i, f in enumerate(itertools.islice(files, MAX_DISPLAY), 1)
+    ]
+    if len(files) > MAX_DISPLAY:
+        lines.append(f"  ... and {len(files) - MAX_DISPLAY} more ({MAX_DISPLAY + 1}-{len(files)})")
+    sys.stdout.write("\n".join(lines) + "\n\n")
+
+
+def parse_selection(selection: str, count: int) -> Tuple[List[int], List[int]]:
+    """
+    Parse a file selection such as "1,3,5-7" into file numbers.
 
+    Any non-digit characters separate entries, duplicates are dropped and
+    ranges may be given in either order.
 
-def display_files(files: List[Path]) -> None:
-    """Display the list of found PBIX files."""
-    print(f"Found {len(files)} PBIX file(s):")
-    print()
-    for i, f in enumerate(files, 1):
-        size_mb = f.stat().st_size / (1024 * 1024)
-        print(f"  {i}. {f.name} ({size_mb:.1f} MB)")
-    print()
+    Args:
+        selection: Text entered by the user.
+        count: Number of files available.
+
+    Returns:
+        Tuple of (valid numbers, invalid numbers), each sorted and 1-based.
+    """
+    indices = set()
+    invalid = set()
+    for start, end in _NUM_RE.findall(selection):
+        first = int(start)
+        last = int(end) if end else first
+        if first > last:
+            first, last = last, first
 
+        invalid.update(n for n in (first, last) if not 1 <= n <= count)
+        indices.update(range(max(first, 1), min(last, count) + 1))
 
-def get_user_selection(files: List[Path]) -> Optional[List[Path]]:
+    return sorted(indices), sorted(invalid)
+
+
+def get_user_selection(files: List[PbixEntry]) -> Optional[List[PbixEntry]]:
     """
     Prompt user to select which files to convert.
 
@@ -73,7 +192,7 @@ def get_user_selection(files: List[Path]) -> Optional[List[Path]]:
     """
     print("Options:")
     print("  [A] Convert all files")
-    print("  [S] Select specific files (enter numbers separated by commas)")
+    print("  [S] Select specific files (enter numbers separated by commas, ranges like 2-5)")
     print("  [Q] Quit")
     print()
 
@@ -87,34 +206,37 @@ def get_user_selection(files: List[Path]) -> Optional[List[Path]]:
             return files
 
         if choice == 'S':
-            selection = input("Enter file numbers (e.g., 1,3,5): ").strip()
-            try:
-                indices = [int(x.strip()) for x in selection.split(',')]
-                selected = []
-                for idx in indices:
-                    if 1 <= idx <= len(files):
-                        selected.append(files[idx - 1])
-                    else:
-                        print(f"  Warning: Ignoring invalid number {idx}")
-
-                if selected:
-                    return selected
-                else:
-                    print("  No valid files selected. Please try again.")
-            except ValueError:
+            selection = input("Enter file numbers (e.g., 1,3,5-7): ").strip()
+            indices, invalid = parse_selection(selection, len(files))
+
+            if not indices and not invalid:
                 print("  Invalid input. Please enter numbers separated by commas.")
+                continue
+
+            for idx in invalid:
+                print(f"  Warning: Ignoring invalid number {idx}")
+
+            if indices:
+                return [files[idx - 1] for idx in indices]
+
+            print("  No valid files selected. Please try again.")
             continue
 
         print("  Invalid choice. Please enter A, S, or Q.")
 
 
-def check_prerequisites() -> bool:
+def check_prerequisites(kill_pbi: bool = False) -> bool:
     """
     Check that all prerequisites are met.
 
+    Args:
+        kill_pbi: Close a running Power BI Desktop without asking.
+
     Returns:
         True if all prerequisites are met, False otherwise.
     """
+    global _PBI_PATH
+
     print("Checking prerequisites...")
 
     # Check for Power BI Desktop
@@ -141,7 +263,10 @@ def check_prerequisites() -> bool:
         print()
         print("WARNING: Power BI Desktop is currently running.")
         print()
-        response = input("Close Power BI Desktop to continue? [Y/N]: ").strip().upper()
+        if kill_pbi:
+            response = 'Y'
+        else:
+            response = input("Close Power BI Desktop to continue? [Y/N]: ").strip().upper()
         if response == 'Y':
             print("  Closing Power BI Desktop...")
             kill_pbi_desktop()
@@ -151,55 +276,342 @@ def check_prerequisites() -> bool:
             print("Please close Power BI Desktop manually and try again.")
             return False
 
+    _PBI_PATH = pbi_path
     print("  Prerequisites OK")
     print()
     return True
 
 
-def convert_files(files: List[Path], output_base: Path) -> dict:
+def _file_stamp(pbix_file: Path) -> str:
+    """Summarize a PBIX file's size and mtime as "<size>:<mtime_ns>"."""
+    st = os.stat(pbix_file, follow_symlinks=False)
+    return f"{st.st_size}:{st.st_mtime_ns}"
+
+
+def _file_digest(pbix_file: Path) -> str:
+    """
+    Hash the first and last HASH_SAMPLE_SIZE bytes of a PBIX file.
+
+    PBIX files can be several GB, so only the ends are read. A PBIX is a ZIP
+    archive, whose central directory at the end changes with any content.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    with open(pbix_file, 'rb') as f:
+        digest.update(f.read(HASH_SAMPLE_SIZE))
+        size = f.seek(0, os.SEEK_END)
+        if size > HASH_SAMPLE_SIZE:
+            f.seek(max(HASH_SAMPLE_SIZE, size - HASH_SAMPLE_SIZE))
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def _load_cache(output_base: str) -> dict:
+    """Load the conversion cache, or an empty one if missing or unreadable."""
+    try:
+        with open(os.path.join(output_base, CACHE_FILE_NAME), encoding='utf-8') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def _save_cache(output_base: str, cache: dict) -> None:
+    """
+    Write the conversion cache. Failing to write it is not fatal.
+
+    The cache is written to a temporary name first and then swapped in, so
+    an interruption never leaves a half-written file behind.
+    """
+    path = os.path.join(output_base, CACHE_FILE_NAME)
+    tmp_path = path + ".tmp"
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(cache, f, indent=2)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print(f"  Warning: Could not write conversion cache: {e}")
+
+
+def is_already_converted(cache: dict, pbix_file: Path, verify: bool = False) -> bool:
+    """
+    Check whether a PBIX file was converted by an earlier run and is unchanged.
+
+    Args:
+        cache: Conversion cache loaded with _load_cache().
+        pbix_file: PBIX file about to be converted.
+        verify: Also compare a hash of the file contents, not just size and mtime.
+
+    Returns:
+        True if the earlier conversion succeeded and its output still exists.
+    """
+    entry = cache.get(os.path.abspath(pbix_file))
+    # Ignore malformed entries, e.g. from a hand-edited cache
+    if not isinstance(entry, dict) or not isinstance(entry.get('output_folder'), str):
+        return False
+    if not entry.get('success') or entry.get('project_name') != pbix_file.stem:
+        return False
+
+    try:
+        if entry.get('stamp') != _file_stamp(pbix_file):
+            return False
+    except OSError:
+        return False
+
+    pbip_file = os.path.join(entry['output_folder'], f"{pbix_file.stem}.pbip")
+    if not os.path.exists(pbip_file):
+        return False
+
+    return not verify or entry.get('digest') == _file_digest(pbix_file)
+
+
+def remember_conversion(cache: dict, pbix_file: Path, output_folder: str, success: bool) -> None:
+    """Record a conversion result in the cache."""
+    try:
+        stamp = _file_stamp(pbix_file)
+        digest = _file_digest(pbix_file)
+    except OSError:
+        return
+
+    cache[os.path.abspath(pbix_file)] = {
+        'stamp': stamp,
+        'project_name': pbix_file.stem,
+        'converted_at': datetime.now().isoformat(timespec='seconds'),
+        # Absolute, so the next run finds it from any working directory
+        'output_folder': os.path.abspath(output_folder),
+        'success': success,
+        'digest': digest,
+    }
+
+
+def record_result(results: dict, pbix_file: Path, success: bool, message: str) -> None:
+    """Record the outcome of one conversion."""
+    if success:
+        results['success'].append(pbix_file.name)
+    else:
+        results['failed'].append((pbix_file.name, message))
+
+
+def _format_duration(seconds: float) -> str:
+    """Format a duration as e.g. "38s", "4m 05s" or "1h 02m"."""
+    seconds = int(seconds)
+    if seconds < 60:
+        return f"{seconds}s"
+    minutes, seconds = divmod(seconds, 60)
+    if minutes < 60:
+        return f"{minutes}m {seconds:02d}s"
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}h {minutes:02d}m"
+
+
+def _timing(recent: deque, remaining: int) -> str:
+    """Describe the average time per file and the ETA for the remaining files."""
+    if not recent:
+        return ""
+    average = sum(recent) / len(recent)
+    return f"(avg {_format_duration(average)}, ETA {_format_duration(average * remaining)})"
+
+
+def print_progress(i: int, total: int, name: str, status: str) -> None:
+    """Overwrite the progress line with the status of file i of total."""
+    # A line that wraps can't be rewound with \r, so stay one short of the
+    # console width and pad so a shorter line fully covers the previous one
+    width = max(shutil.get_terminal_size().columns - 1, 1)
+    prefix = f"[{i:4d}/{total}] "
+    # Narrow the name column before cutting off the status
+    name_width = min(40, max(10, width - len(prefix) - len(status) - 1))
+    line = f"{prefix}{name:<{name_width}.{name_width}} {status}"
+    print(f"\r{line[:width]:<{width}}", end='', flush=True)
+
+
+def report_result(
+    i: int,
+    total: int,
+    pbix_file: Path,
+    success: bool,
+    message: str,
+    output: str,
+    timing: str
+) -> None:
+    """
+    Show the outcome of one conversion on the progress line.
+
+    Successes are overwritten by the next update. Failures are kept on
+    screen, followed by the progress the conversion printed and the reason.
+    """
+    if success:
+        print_progress(i, total, pbix_file.name, f"SUCCESS {timing}")
+        return
+
+    print_progress(i, total, pbix_file.name, f"FAILED {timing}")
+    print()
+    sys.stdout.write(output)
+    print(f"  FAILED: {message}")
+
+
+def _run_conversions(
+    files: List[PbixEntry],
+    output_base: str,
+    workers: int,
+    pbi_path: Optional[str],
+    results: dict,
+    cache: dict
+) -> None:
+    """Convert files, recording each outcome in results and cache as it finishes."""
+    total = len(files)
+    if not total:
+        return
+
+    # Seconds between recent completions, for the ETA. In parallel mode this
+    # is the throughput rather than the time a single file takes.
+    recent = deque(maxlen=PROGRESS_WINDOW)
+    last = time.monotonic()
+
+    if workers > 1 and total > 1:
+        # iter_convert_parallel creates the output folders before starting
+        # the workers
+        jobs = [
+            (os.fspath(entry.path), os.path.join(output_base, entry.path.stem), entry.path.stem)
+            for entry in files
+        ]
+
+        print(f"\nConverting {total} files with up to {workers} Power BI Desktop instances...")
+        print_progress(0, total, "", "converting...")
+        done = 0
+        # Closed on the way out, so on Ctrl+C the queued jobs are cancelled
+        # and the running ones finish before the interruption is reported
+        with contextlib.closing(iter_convert_parallel(jobs, workers, pbi_path)) as conversions:
+            for index, success, message, output in conversions:
+                done += 1
+                now = time.monotonic()
+                recent.append(now - last)
+                last = now
+
+                pbix_file = files[index].path
+                # output holds the progress lines the worker buffered while it ran
+                report_result(done, total, pbix_file, success, message, output,
+                              _timing(recent, total - done))
+                record_result(results, pbix_file, success, message)
+                remember_conversion(cache, pbix_file, jobs[index][1], success)
+                _save_cache(output_base, cache)
+        print()
+        return
+
+    # Create every output folder up front, so the conversions don't have to
+    jobs = []
+    for entry in files:
+        output_folder = os.path.join(output_base, entry.path.stem)
+        os.makedirs(output_folder, exist_ok=True)
+        jobs.append((os.fspath(entry.path), output_folder, entry.path.stem))
+
+    print()
+
+    # One Power BI Desktop session for all files, closed when the loop ends
+    # or is interrupted
+    with contextlib.closing(iter_convert_batch(jobs, pbi_path, output_exists=True)) as conversions:
+        for i, entry in enumerate(files, 1):
+            pbix_file = entry.path
+
+            print_progress(i, total, pbix_file.name,
+                           f"converting... {_timing(recent, total - i + 1)}")
+
+            # Keep the automation's step messages off the progress line;
+            # they're only shown if the conversion fails
+            output = io.StringIO()
+            with contextlib.redirect_stdout(output):
+                success, message = next(conversions)
+
+            now = time.monotonic()
+            recent.append(now - last)
+            last = now
+
+            report_result(i, total, pbix_file, success, message, output.getvalue(),
+                          _timing(recent, total - i))
+            record_result(results, pbix_file, success, message)
+            remember_conversion(cache, pbix_file, jobs[i - 1][1], success)
+            _save_cache(output_base, cache)
+    print()
+
+
+def convert_files(
+    files: List[PbixEntry],
+    output_base: str,
+    workers: int = 1,
+    pbi_path: Optional[str] = None,
+    force: bool = False,
+    verify: bool = False
+) -> dict:
     """
     Convert a list of PBIX files to PBIP format.
 
+    Files converted by an earlier run, including an interrupted one, that
+    haven't changed since are skipped unless force is set. The conversion
+    cache is saved after each file, and Ctrl+C stops the run but still
+    returns the results so far.
+
     Args:
         files: List of PBIX files to convert.
         output_base: Base output directory.
+        workers: Number of Power BI Desktop instances to run concurrently.
+        pbi_path: Path to PBIDesktop.exe, as resolved by check_prerequisites().
+        force: Convert every file, ignoring the conversion cache.
+        verify: Compare file content hashes, not just size and mtime, when
+            checking the conversion cache.
 
     Returns:
-        Dictionary with conversion results.
+        Dictionary with conversion results. 'interrupted' is set to True if
+        the run was stopped with Ctrl+C.
     """
     results = {
         'success': [],
         'failed': [],
     }
 
-    total = len(files)
-
-    for i, pbix_file in enumerate(files, 1):
-        project_name = pbix_file.stem
-        output_folder = output_base / project_name
-
-        print(f"\nConverting {pbix_file.name}... [{i}/{total}]")
-        print(f"  Output: {output_folder}")
+    # Paths are handled as strings: they're only passed on to
+    # pbi_automation, and joining strings is cheaper than Path division.
+    output_base = os.fspath(output_base)
+    cache = _load_cache(output_base)
+    if not force:
+        pending = []
+        for entry in files:
+            if is_already_converted(cache, entry.path, verify):
+                print(f"\nSkipping {entry.path.name} (unchanged since last conversion)")
+                results['success'].append(entry.path.name)
+            else:
+                pending.append(entry)
+        files = pending
+
+    try:
+        _run_conversions(files, output_base, workers, pbi_path, results, cache)
+    except KeyboardInterrupt:
+        print()
+        print("Conversion interrupted. Run again to continue where it stopped.")
+        results['interrupted'] = True
 
-        print("  Opening Power BI Desktop...")
-        success, message = convert_pbix_to_pbip(
-            str(pbix_file),
-            str(output_folder),
-            project_name
-        )
+    return results
 
-        if success:
-            print(f"  SUCCESS: {message}")
-            results['success'].append(pbix_file.name)
-        else:
-            print(f"  FAILED: {message}")
-            results['failed'].append((pbix_file.name, message))
 
-    return results
+def print_summary(results: dict, as_json: bool = False) -> None:
+    """
+    Print the conversion summary.
 
+    Args:
+        results: Conversion results from convert_files().
+        as_json: Print the results as a JSON object instead.
+    """
+    if as_json:
+        summary = {
+            'success': results['success'],
+            'failed': [
+                {'file': name, 'reason': reason}
+                for name, reason in results['failed']
+            ],
+            'interrupted': results.get('interrupted', False),
+        }
+        if 'error' in results:
+            summary['error'] = results['error']
+        print(json.dumps(summary, indent=2))
+        return
 
-def print_summary(results: dict) -> None:
-    """Print the conversion summary."""
     print()
     print("=" * 50)
     print("  Conversion Summary")
@@ -209,30 +621,121 @@ def print_summary(results: dict) -> None:
     print(f"  Failed:     {len(results['failed'])}")
     print()
 
+    lines = []
     if results['success']:
-        print("Successful conversions:")
-        for name in results['success']:
-            print(f"    {name}")
-        print()
+        lines.append("Successful conversions:")
+        lines += [f"    {name}" for name in results['success']]
+        lines.append("")
 
     if results['failed']:
-        print("Failed conversions:")
+        lines.append("Failed conversions:")
         for name, reason in results['failed']:
-            print(f"    {name}")
-            print(f"      Reason: {reason}")
-        print()
+            lines.append(f"    {name}")
+            lines.append(f"      Reason: {reason}")
+        lines.append("")
+
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+
+
+def _worker_count(value: str) -> int:
+    """argparse type for --workers: an integer from 1 to MAX_WORKERS."""
+    try:
+        workers = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: '{value}'")
+    if not 1 <= workers <= MAX_WORKERS:
+        raise argparse.ArgumentTypeError(f"must be between 1 and {MAX_WORKERS}, got {workers}")
+    return workers
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Convert Power BI PBIX files to PBIP project format."
+    )
+    parser.add_argument(
+        'directory',
+        nargs='?',
+        default=None,
+        help="Directory containing PBIX files (default: current directory)"
+    )
+    choice = parser.add_mutually_exclusive_group()
+    choice.add_argument(
+        '-a', '--all',
+        action='store_true',
+        help="Convert all PBIX files found, without asking"
+    )
+    choice.add_argument(
+        '--select',
+        metavar='S',
+        help="Convert the files with these numbers from the listing, e.g. 1,3,5-7"
+    )
+    parser.add_argument(
+        '-y', '--yes',
+        action='store_true',
+        help="Don't ask for confirmation (also closes a running Power BI Desktop)"
+    )
+    parser.add_argument(
+        '--kill-pbi',
+        action='store_true',
+        help="Close a running Power BI Desktop without asking"
+    )
+    parser.add_argument(
+        '--output-dir',
+        metavar='DIR',
+        help=f"Where to save the projects (default: <directory>/{OUTPUT_FOLDER_NAME})"
+    )
+    parser.add_argument(
+        '--json',
+        action='store_true',
+        help="Print only the conversion summary to stdout, as JSON; other output goes to stderr"
+    )
+    parser.add_argument(
+        '--workers',
+        type=_worker_count,
+        default=DEFAULT_WORKERS,
+        metavar='N',
+        help=(
+            f"Number of Power BI Desktop instances to run at once, "
+            f"1-{MAX_WORKERS} (default: {DEFAULT_WORKERS})"
+        )
+    )
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help="Convert all selected files, even if unchanged since the last conversion"
+    )
+    parser.add_argument(
+        '--verify',
+        action='store_true',
+        help="Compare file contents, not just size and modification time, to detect changes"
+    )
+    return parser.parse_args(argv)
+
+
+def run(args: argparse.Namespace) -> dict:
+    """
+    Select, confirm and convert PBIX files as requested on the command line.
 
+    Args:
+        args: Parsed command line arguments.
 
-def main():
-    """Main entry point."""
+    Returns:
+        Dictionary with conversion results.
+
+    Raises:
+        RunAborted: If the run stops before converting, e.g. because no
+            files were found or the user cancelled.
+    """
     print_header()
 
     # Determine working directory
-    if len(sys.argv) > 1:
-        work_dir = sys.argv[1]
+    if args.directory:
+        work_dir = args.directory
         if not os.path.isdir(work_dir):
             print(f"ERROR: '{work_dir}' is not a valid directory.")
-            sys.exit(1)
+            raise RunAborted(f"'{work_dir}' is not a valid directory", 1)
     else:
         work_dir = os.getcwd()
 
@@ -246,18 +749,29 @@ def main():
         print("No PBIX files found in the current directory.")
         print()
         print("Usage: python pbix_converter.py [directory]")
-        sys.exit(0)
+        raise RunAborted("No PBIX files found", 0)
 
     # Display found files
     display_files(pbix_files)
 
     # Get user selection
-    selected_files = get_user_selection(pbix_files)
+    if args.all:
+        selected_files = pbix_files
+    elif args.select is not None:
+        indices, invalid = parse_selection(args.select, len(pbix_files))
+        for idx in invalid:
+            print(f"  Warning: Ignoring invalid number {idx}")
+        if not indices:
+            print(f"ERROR: No valid files selected by '{args.select}'.")
+            raise RunAborted(f"No valid files selected by '{args.select}'", 1)
+        selected_files = [pbix_files[idx - 1] for idx in indices]
+    else:
+        selected_files = get_user_selection(pbix_files)
 
     if selected_files is None:
         print()
         print("Conversion cancelled.")
-        sys.exit(0)
+        raise RunAborted("Conversion cancelled", 0)
 
     print()
     print(f"Selected {len(selected_files)} file(s) for conversion.")
@@ -267,30 +781,61 @@ def main():
     print("IMPORTANT: During conversion, do not use the mouse or keyboard.")
     print("The automation needs to control Power BI Desktop.")
     print()
-    confirm = input("Ready to begin? [Y/N]: ").strip().upper()
+    if args.yes:
+        confirm = 'Y'
+    else:
+        confirm = input("Ready to begin? [Y/N]: ").strip().upper()
 
     if confirm != 'Y':
         print()
         print("Conversion cancelled.")
-        sys.exit(0)
+        raise RunAborted("Conversion cancelled", 0)
 
     # Check prerequisites
     print()
-    if not check_prerequisites():
-        sys.exit(1)
+    if not check_prerequisites(kill_pbi=args.yes or args.kill_pbi):
+        raise RunAborted("Prerequisites not met", 1)
 
     # Create output directory
-    output_base = Path(work_dir) / OUTPUT_FOLDER_NAME
-    output_base.mkdir(exist_ok=True)
+    output_base = args.output_dir or os.path.join(work_dir, OUTPUT_FOLDER_NAME)
+    os.makedirs(output_base, exist_ok=True)
     print(f"Output folder: {output_base}")
 
     # Perform conversions
-    results = convert_files(selected_files, output_base)
+    results = convert_files(
+        selected_files,
+        output_base,
+        args.workers,
+        _PBI_PATH,
+        force=args.force,
+        verify=args.verify
+    )
+    return results
+
+
+def main():
+    """Main entry point."""
+    args = parse_args()
+
+    try:
+        if args.json:
+            # Keep stdout for the JSON summary; progress and prompts go to stderr
+            with contextlib.redirect_stdout(sys.stderr):
+                results = run(args)
+        else:
+            results = run(args)
+    except RunAborted as e:
+        if args.json:
+            # Scripts parsing stdout still get a summary, with the reason
+            print_summary({'success': [], 'failed': [], 'error': str(e)}, as_json=True)
+        sys.exit(e.exit_code)
 
     # Print summary
-    print_summary(results)
+    print_summary(results, as_json=args.json)
 
     # Exit code based on results
+    if results.get('interrupted'):
+        sys.exit(130)
     if results['failed']:
         sys.exit(1)
     sys.exit(0)